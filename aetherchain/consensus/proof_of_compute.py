@@ -0,0 +1,307 @@
+"""
+AetherChain Proof-of-Compute Implementation
+
+Based on the AetherChain white paper, Proof-of-Compute (PoC) is a hybrid consensus mechanism:
+- Hybrid of PoW and PoS tailored to OS workloads
+- Incorporates computational oracles
+- Uses ZK-SNARK proofs for verification
+- Ties incentives to useful work (verifying OS state)
+- Uses thermodynamic sampling for tamper-resistance
+"""
+
+import hashlib
+import time
+import json
+from typing import List, Dict, Any, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.transaction import Transaction
+from core.block import Block
+
+class ProofOfCompute:
+    """
+    AetherChain Proof-of-Compute class
+    
+    Implements the PoC consensus mechanism with:
+    - Computational puzzle solving
+    - ZK-SNARK proof generation
+    - Thermodynamic sampling
+    - Dynamic difficulty adjustment
+    """
+    
+    def __init__(self, initial_difficulty: int = 4):
+        """
+        Initialize Proof-of-Compute
+        
+        Args:
+            initial_difficulty: Initial mining difficulty
+        """
+        self.difficulty = initial_difficulty
+        self.target_interval = 60  # Target 1-minute intervals (OS-scale latency)
+        self.difficulty_window = 201  # 201-block window for stability
+    
+    def calculate_target(self) -> str:
+        """
+        Calculate the target hash based on current difficulty
+        
+        Returns:
+            str: Target hash prefix (leading zeros)
+        """
+        return "0" * self.difficulty
+    
+    def calculate_target_int(self) -> int:
+        """
+        Calculate the target as an integer bound on the 256-bit hash
+        
+        A hash meets the target when, read as a big-endian integer, it is
+        below this bound (equivalent to the leading-zeros prefix check).
+        
+        Returns:
+            int: Exclusive upper bound for a valid hash
+        """
+        return 1 << (256 - 4 * self.difficulty)
+    
+    def _digest_ceiling(self) -> bytes:
+        """
+        Largest 32-byte digest that meets the current difficulty
+        
+        A digest meets the target when its hex form starts with `difficulty`
+        zeros, i.e. when it compares <= this big-endian bound as raw bytes.
+        
+        Returns:
+            bytes: Inclusive upper bound for a valid digest
+        """
+        return (self.calculate_target_int() - 1).to_bytes(32, 'big')
+    
+    def solve_puzzle(self, block_header: str) -> Tuple[int, str]:
+        """
+        Solve the PoC puzzle: find nonce n such that H(h || n) <= target
+        
+        According to the white paper:
+        "Given block header h = H(B_{i-1} || time || target), find nonce n such that
+        H(h || n) <= target * D where D is dynamic difficulty"
+        
+        Args:
+            block_header: Block header to hash
+            
+        Returns:
+            tuple: (nonce, hash) that satisfies the puzzle
+        """
+        # Absorb the fixed header once (SHA-256 midstate) and only feed the
+        # nonce per attempt; the digest stays binary until a solution is found
+        midstate = hashlib.sha256(block_header.encode('utf-8'))
+        ceiling = self._digest_ceiling()
+        nonce = 0
+        
+        while True:
+            # Create hash of header + nonce
+            attempt = midstate.copy()
+            attempt.update(b'%d' % nonce)
+            digest = attempt.digest()
+            
+            # Check if hash meets target
+            if digest <= ceiling:
+                return (nonce, digest.hex())
+            
+            nonce += 1
+            
+            # Prevent infinite loop in example
+            if nonce > 1000000:
+                break
+                
+        return (nonce, digest.hex())
+    
+    def generate_computational_proof(self, transactions: List[Transaction]) -> Dict[str, Any]:
+        """
+        Generate computational proof by executing transactions in emulator
+        
+        According to the white paper:
+        "Nodes must execute a subset of transactions in an emulator, attesting via a
+        succinct proof π (e.g., Groth16 ZK-SNARK) that outputs match commitments"
+        
+        In this implementation, we simulate the process:
+        
+        Args:
+            transactions: List of transactions to execute
+            
+        Returns:
+            dict: Computational proof data
+        """
+        # In a real implementation, this would:
+        # 1. Execute transactions in a WASM-based sandbox
+        # 2. Generate ZK-SNARK proof that outputs match commitments
+        # 3. Sample energy from TSU for thermodynamic validation
+        
+        # Simulate execution and proof generation
+        execution_results = []
+        for tx in transactions:
+            # Simulate transaction execution
+            result = {
+                'tx_id': tx.hash(),
+                'executed': True,
+                'outputs_match_commitments': True,
+                'timestamp': time.time()
+            }
+            execution_results.append(result)
+        
+        # Generate simulated ZK-SNARK proof
+        proof_data = {
+            'type': 'zk-snark',
+            'proof': 'simulated_groth16_proof_data',  # Would be actual proof data
+            'verification_key': 'verification_key_placeholder',
+            'public_inputs': [tx.hash() for tx in transactions],
+            'execution_results': execution_results
+        }
+        
+        return proof_data
+    
+    def sample_thermodynamic_entropy(self) -> Dict[str, Any]:
+        """
+        Sample thermodynamic entropy from TSU (Thermal Sampling Unit)
+        
+        According to the white paper:
+        "PoC(B_i) = (n, π, energy_sample from TSU)
+        ...thermodynamic sampling ensures tamper-resistance"
+        
+        Returns:
+            dict: Thermodynamic entropy sample
+        """
+        # In a real implementation, this would interface with hardware TSU
+        # For simulation, we generate pseudorandom entropy data
+        
+        import random
+        entropy_sample = {
+            'type': 'tsu-entropy',
+            'timestamp': time.time(),
+            'thermal_noise': [random.random() for _ in range(256)],  # Simulated thermal noise
+            'entropy_bits': 256,
+            'tamper_evidence': False  # Would detect physical tampering
+        }
+        
+        return entropy_sample
+    
+    def adjust_difficulty(self, block_times: List[float]) -> int:
+        """
+        Adjust difficulty based on recent block times
+        
+        According to the white paper:
+        "D_{i+1} = D_i * (sum_{j=i-200}^i t_j / 201) / T
+        (201-block window for stability)"
+        
+        Args:
+            block_times: List of recent block timestamps
+            
+        Returns:
+            int: New difficulty level
+        """
+        if len(block_times) < 2:
+            return self.difficulty
+            
+        # Calculate average block time in the window
+        if len(block_times) > self.difficulty_window:
+            # Use only the most recent window
+            recent_times = block_times[-self.difficulty_window:]
+        else:
+            recent_times = block_times
+            
+        # Calculate time differences between consecutive blocks
+        time_differences = []
+        for i in range(1, len(recent_times)):
+            time_differences.append(recent_times[i] - recent_times[i-1])
+            
+        if not time_differences:
+            return self.difficulty
+            
+        avg_block_time = sum(time_differences) / len(time_differences)
+        
+        # Adjust difficulty
+        # If blocks are coming too fast, increase difficulty
+        # If blocks are coming too slow, decrease difficulty
+        if avg_block_time > 0:
+            adjustment_factor = self.target_interval / avg_block_time
+            new_difficulty = int(self.difficulty * adjustment_factor)
+            
+            # Ensure difficulty doesn't go below 1
+            new_difficulty = max(1, new_difficulty)
+            
+            # Limit rapid changes (not more than 2x in either direction)
+            if new_difficulty > self.difficulty * 2:
+                new_difficulty = self.difficulty * 2
+            elif new_difficulty < self.difficulty // 2:
+                new_difficulty = max(1, self.difficulty // 2)
+                
+            self.difficulty = new_difficulty
+            
+        return self.difficulty
+    
+    def validate_proof(self, block: Block) -> bool:
+        """
+        Validate the Proof-of-Compute for a block
+        
+        Args:
+            block: Block to validate
+            
+        Returns:
+            bool: True if proof is valid, False otherwise
+        """
+        # Check 1: Verify block hash meets difficulty target
+        if int(block.compute_hash(), 16) >= self.calculate_target_int():
+            return False
+            
+        # Check 2: Verify ZK-SNARK proof (simplified)
+        if not block.proof_of_compute:
+            return False
+            
+        # In a real implementation, we would:
+        # 1. Verify the ZK-SNARK proof using the verification key
+        # 2. Check that the proof corresponds to the block's transactions
+        # 3. Validate the thermodynamic entropy sample
+        
+        # For simulation, we just check if proof exists
+        proof_data = block.proof_of_compute.get('proof', '')
+        if not proof_data or proof_data == '':
+            return False
+            
+        # Check 3: Validate thermodynamic sampling
+        energy_sample = block.proof_of_compute.get('energy_sample', '')
+        if not energy_sample or energy_sample == '':
+            return False
+            
+        return True
+
+# Example usage
+if __name__ == "__main__":
+    # Create PoC instance
+    poc = ProofOfCompute(initial_difficulty=2)
+    
+    print(f"Initial difficulty: {poc.difficulty}")
+    print(f"Target: {poc.calculate_target()}")
+    
+    # Simulate solving a puzzle
+    block_header = "sample_block_header_data"
+    nonce, hash_result = poc.solve_puzzle(block_header)
+    print(f"Solved puzzle with nonce: {nonce}")
+    print(f"Hash result: {hash_result}")
+    
+    # Generate computational proof
+    sample_transactions = [
+        Transaction(
+            inputs=[{"tx_id": "tx1", "output_index": 0, "amount": 100}],
+            outputs=[{"address": "addr1", "amount": 100}]
+        )
+    ]
+    
+    proof = poc.generate_computational_proof(sample_transactions)
+    print(f"Generated computational proof: {proof['type']}")
+    
+    # Sample thermodynamic entropy
+    entropy = poc.sample_thermodynamic_entropy()
+    print(f"Sampled entropy bits: {entropy['entropy_bits']}")
+    
+    # Simulate difficulty adjustment
+    # Create a series of block timestamps (1 block per minute)
+    block_times = [time.time() - (10-i)*60 for i in range(10)]
+    new_difficulty = poc.adjust_difficulty(block_times)
+    print(f"Adjusted difficulty: {new_difficulty}")
\ No newline at end of file
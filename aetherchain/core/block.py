@@ -0,0 +1,237 @@
+"""
+AetherChain Block Implementation
+
+Based on the AetherChain white paper, blocks form the blockchain structure:
+- H(B_{i-1}): Hash of the previous block
+- M(T_1, ..., T_m): Merkle root of transactions
+- σ: Network signature aggregate
+- PoC(B_i): Proof-of-Compute
+"""
+
+import hashlib
+import json
+import time
+from typing import List, Dict, Any
+from .transaction import Transaction
+
+def compute_merkle_root(leaves: List[bytes]) -> str:
+    """
+    Calculate the Merkle root of a list of transaction digests
+    
+    Args:
+        leaves: Raw 32-byte transaction digests, in block order
+        
+    Returns:
+        str: Hexadecimal representation of the Merkle root
+    """
+    if not leaves:
+        return hashlib.sha256(b"").hexdigest()
+        
+    # Work on raw 32-byte digests; only the final root is hex-encoded
+    sha256 = hashlib.sha256
+    level = list(leaves)
+    
+    # Build Merkle tree
+    while len(level) > 1:
+        # Pad with last digest if odd number
+        if len(level) % 2 == 1:
+            level.append(level[-1])
+        
+        # Combine pairs
+        level = [sha256(level[i] + level[i+1]).digest() for i in range(0, len(level), 2)]
+        
+    return level[0].hex()
+
+class Block:
+    """
+    AetherChain Block class
+    
+    Represents a block in the blockchain containing:
+    - Previous block hash
+    - List of transactions
+    - Merkle root of transactions
+    - Timestamp
+    - Network signature aggregate
+    - Proof-of-Compute
+    """
+    
+    __slots__ = ('index', 'transactions', 'previous_hash', 'timestamp', '_hash', '_nonce',
+                 'merkle_root', 'proof_of_compute', 'network_signature')
+    
+    def __init__(self, index: int, transactions: List[Transaction], previous_hash: str, 
+                 timestamp: float = None, nonce: int = 0, merkle_root: str = None):
+        """
+        Initialize a new block
+        
+        Args:
+            index: Block index in the chain
+            transactions: List of transactions in the block
+            previous_hash: Hash of the previous block
+            timestamp: Block creation timestamp
+            nonce: Nonce for Proof-of-Compute
+            merkle_root: Precomputed Merkle root of the transactions (computed if omitted)
+        """
+        self.index = index
+        self.transactions = transactions
+        self.previous_hash = previous_hash
+        self.timestamp = timestamp or time.time()
+        self._hash = None  # cached hash(), reset whenever the nonce changes
+        self.nonce = nonce
+        self.merkle_root = merkle_root or self._calculate_merkle_root()
+        self.proof_of_compute = None  # Will be set during mining
+        self.network_signature = None  # Will be set by network layer
+    
+    @property
+    def nonce(self) -> int:
+        """
+        Nonce for Proof-of-Compute
+        
+        Returns:
+            int: Current nonce
+        """
+        return self._nonce
+    
+    @nonce.setter
+    def nonce(self, value: int):
+        self._nonce = value
+        self._hash = None
+        
+    def _calculate_merkle_root(self) -> str:
+        """
+        Calculate the Merkle root of transactions
+        
+        Returns:
+            str: Hexadecimal representation of the Merkle root
+        """
+        return compute_merkle_root([tx.digest() for tx in self.transactions])
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert block to dictionary representation
+        
+        Returns:
+            dict: Dictionary representation of the block
+        """
+        return {
+            'index': self.index,
+            'transactions': [tx.to_dict() for tx in self.transactions],
+            'previous_hash': self.previous_hash,
+            'timestamp': self.timestamp,
+            'nonce': self.nonce,
+            'merkle_root': self.merkle_root,
+            'proof_of_compute': self.proof_of_compute,
+            'network_signature': self.network_signature
+        }
+    
+    def serialize(self) -> str:
+        """
+        Serialize block to JSON string
+        
+        Returns:
+            str: JSON string representation
+        """
+        # Convert transactions to serializable format
+        data = self.to_dict()
+        return json.dumps(data, sort_keys=True)
+    
+    def _header_prefix(self) -> str:
+        """
+        Get the block header fields that precede the nonce
+        
+        Returns:
+            str: Concatenated index, previous hash, Merkle root and timestamp
+        """
+        return f"{self.index}{self.previous_hash}{self.merkle_root}{self.timestamp}"
+    
+    def compute_hash(self) -> str:
+        """
+        Calculate SHA-256 hash of the block header from its current fields
+        
+        Unlike hash(), this is never cached; validation uses it so edits to
+        any header field are detected.
+        
+        Returns:
+            str: Hexadecimal representation of the hash
+        """
+        # Block header includes: index, previous_hash, merkle_root, timestamp, nonce
+        header_data = f"{self._header_prefix()}{self.nonce}"
+        return hashlib.sha256(header_data.encode('utf-8')).hexdigest()
+    
+    def hash(self) -> str:
+        """
+        Get the SHA-256 hash of the block header
+        
+        Cached until the nonce changes; use compute_hash() when the other
+        header fields may have been modified.
+        
+        Returns:
+            str: Hexadecimal representation of the hash
+        """
+        if self._hash is None:
+            self._hash = self.compute_hash()
+        return self._hash
+    
+    def mine_block(self, difficulty: int):
+        """
+        Mine the block using Proof-of-Compute
+        
+        Args:
+            difficulty: Target difficulty for mining
+        """
+        # This is a simplified version - in practice, this would involve:
+        # 1. Executing a subset of transactions in an emulator
+        # 2. Generating a ZK-SNARK proof that outputs match commitments
+        # 3. Finding a nonce that satisfies the PoC puzzle
+        
+        # The header up to the nonce is fixed, so hash it once (SHA-256
+        # midstate) and only feed the nonce digits per attempt
+        midstate = hashlib.sha256(self._header_prefix().encode('utf-8'))
+        # `difficulty` leading hex zeros <=> big-endian digest <= this bound
+        ceiling = ((1 << (256 - 4 * difficulty)) - 1).to_bytes(32, 'big')
+        nonce = self.nonce
+        while True:
+            attempt = midstate.copy()
+            attempt.update(b'%d' % nonce)
+            if attempt.digest() <= ceiling:
+                break
+            nonce += 1
+        self.nonce = nonce
+            
+        # In a real implementation, we would also:
+        # - Generate ZK-SNARK proof (π)
+        # - Include energy sample from TSU
+        # - Store the full PoC(B_i) = (n, π, energy_sample)
+        self.proof_of_compute = {
+            'nonce': self.nonce,
+            'proof': 'zk_snark_proof_placeholder',  # Would be actual ZK-SNARK proof
+            'energy_sample': 'tsu_energy_sample_placeholder'  # Would be actual TSU sample
+        }
+
+# Example usage
+if __name__ == "__main__":
+    # Create sample transactions
+    tx1 = Transaction(
+        inputs=[{"tx_id": "tx1", "output_index": 0, "amount": 100}],
+        outputs=[{"address": "addr1", "amount": 100}]
+    )
+    
+    tx2 = Transaction(
+        inputs=[{"tx_id": "tx2", "output_index": 0, "amount": 50}],
+        outputs=[{"address": "addr2", "amount": 25}, {"address": "addr3", "amount": 25}]
+    )
+    
+    # Create a block
+    block = Block(
+        index=1,
+        transactions=[tx1, tx2],
+        previous_hash="0000000000000000000000000000000000000000000000000000000000000000"
+    )
+    
+    print(f"Block hash: {block.hash()}")
+    print(f"Merkle root: {block.merkle_root}")
+    
+    # Mine the block (simplified)
+    print("Mining block...")
+    block.mine_block(difficulty=2)
+    print(f"Mined block hash: {block.hash()}")
+    print(f"Proof of Compute: {block.proof_of_compute}")
\ No newline at end of file
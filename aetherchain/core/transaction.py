@@ -0,0 +1,439 @@
+"""
+AetherChain Transaction Implementation
+
+Based on the AetherChain white paper, transactions capture user commands as structured data:
+- Inputs: References to prior outputs
+- Outputs: Intended states
+- Metadata: Timestamp, public key signature (ECDSA secp256k1), and nonce
+"""
+
+import hashlib
+import time
+import json
+import struct
+from collections import namedtuple
+from operator import attrgetter
+from typing import List, Dict, Any, Callable, Sequence, Union
+from coincurve import GLOBAL_CONTEXT, PrivateKey, PublicKey
+
+class TxIO(namedtuple('TxIO', 'address amount currency')):
+    """
+    Fixed-schema transaction input/output for value transfers
+    
+    Fields can also be read by name, as in the dict form (io['amount'],
+    io.get('address')), so code reading inputs/outputs handles both. Only
+    that lookup is dict-like: `in` and iteration still see the tuple values.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key in _TXIO_FIELDS:
+                return getattr(self, key)
+            raise KeyError(key)
+        return super().__getitem__(key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a field by name, as dict.get
+        
+        Args:
+            key: Field name
+            default: Value returned for unknown fields
+            
+        Returns:
+            Field value or default
+        """
+        if key in _TXIO_FIELDS:
+            return getattr(self, key)
+        return default
+
+# Field names accepted by TxIO's name lookups
+_TXIO_FIELDS = frozenset(TxIO._fields)
+
+def _io_to_dict(entry: Union[TxIO, Dict]) -> Dict:
+    """
+    Return the dict form of a transaction input/output
+    
+    Args:
+        entry: TxIO or dict entry
+        
+    Returns:
+        dict: Entry as a dictionary
+    """
+    return entry._asdict() if isinstance(entry, TxIO) else entry
+
+_U32 = struct.Struct('<I')
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+_HEADER = struct.Struct('<dQ')  # timestamp, nonce
+_I64_MIN, _I64_MAX = -2**63, 2**63 - 1
+_NO_KEY = _U32.pack(0xFFFFFFFF)  # length prefix standing for a missing public key
+
+def _encode_str(value: str) -> bytes:
+    """Encode a str as tagged, length-prefixed UTF-8"""
+    data = value.encode('utf-8')
+    return b's' + _U32.pack(len(data)) + data
+
+def _encode_int(value: int) -> bytes:
+    """Encode an int as int64, or as decimal digits when out of range"""
+    if _I64_MIN <= value <= _I64_MAX:
+        return b'i' + _I64.pack(value)
+    digits = str(value).encode('ascii')
+    return b'I' + _U32.pack(len(digits)) + digits
+
+def _encode_float(value: float) -> bytes:
+    """Encode a float as float64"""
+    return b'd' + _F64.pack(value)
+
+def _encode_bool(value: bool) -> bytes:
+    """Encode a bool as its one-byte tag"""
+    return b'T' if value else b'F'
+
+def _encode_none(value: None) -> bytes:
+    """Encode None as its one-byte tag"""
+    return b'N'
+
+# Encoders for the scalar values found in inputs/outputs, by exact type
+_SCALAR_ENCODERS = {
+    str: _encode_str,
+    int: _encode_int,
+    float: _encode_float,
+    bool: _encode_bool,
+    type(None): _encode_none,
+}
+
+def _encode_value(value: Any, out: bytearray):
+    """
+    Append the canonical binary encoding of a value to a buffer
+    
+    Every value is a one-byte type tag followed by a fixed-width or
+    length-prefixed payload; dict keys are encoded in sorted order so equal
+    values always produce equal bytes.
+    
+    Args:
+        value: None, bool, int, float, str, bytes, list/tuple or dict value
+        out: Buffer to append to
+    """
+    encoder = _SCALAR_ENCODERS.get(type(value))
+    if encoder is not None:
+        out += encoder(value)
+    elif isinstance(value, int):
+        out += _encode_int(value)
+    elif isinstance(value, float):
+        out += _encode_float(value)
+    elif isinstance(value, str):
+        out += _encode_str(value)
+    elif isinstance(value, (bytes, bytearray)):
+        out += b'b'
+        out += _U32.pack(len(value))
+        out += value
+    elif isinstance(value, dict):
+        out += b'm'
+        out += _U32.pack(len(value))
+        for key in sorted(value):
+            _encode_value(key, out)
+            _encode_value(value[key], out)
+    elif isinstance(value, (list, tuple)):
+        out += b'l'
+        out += _U32.pack(len(value))
+        for item in value:
+            _encode_value(item, out)
+    else:
+        raise TypeError(f"Cannot canonically encode {type(value).__name__}")
+
+def _encode_scalar(value: Any) -> bytes:
+    """
+    Encode a single input/output value, as _encode_value would
+    
+    Args:
+        value: Value to encode
+        
+    Returns:
+        bytes: Canonical encoding of the value
+    """
+    encoder = _SCALAR_ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    out = bytearray()
+    _encode_value(value, out)
+    return bytes(out)
+
+# Encoded dict header and keys for a TxIO; its fields are already in sorted
+# order, so a TxIO encodes exactly like the equivalent dict
+_TXIO_HEADER = b'm' + _U32.pack(len(TxIO._fields))
+_TXIO_KEYS = tuple(_encode_str(name) for name in TxIO._fields)
+
+def _encode_entries(entries: Sequence[Union[TxIO, Dict]], parts: List[bytes]):
+    """
+    Append the canonical encoding of transaction inputs/outputs to a parts list
+    
+    Entries are flat dicts of scalars, so each key and value is encoded
+    directly instead of recursing through _encode_value. TxIO fields are
+    encoded in place, in field order, without building a dict.
+    
+    Args:
+        entries: Inputs or outputs, as dicts or TxIO tuples
+        parts: Byte strings to append to
+    """
+    address_key, amount_key, currency_key = _TXIO_KEYS
+    parts.append(_U32.pack(len(entries)))
+    for entry in entries:
+        if type(entry) is TxIO:
+            address, amount, currency = entry
+            parts += (_TXIO_HEADER,
+                      address_key, _encode_scalar(address),
+                      amount_key, _encode_scalar(amount),
+                      currency_key, _encode_scalar(currency))
+            continue
+        parts.append(b'm' + _U32.pack(len(entry)))
+        for key in sorted(entry):
+            parts.append(_encode_scalar(key))
+            parts.append(_encode_scalar(entry[key]))
+
+def _hashed_field(name: str, doc: str) -> property:
+    """
+    Build a property for a transaction field covered by the hash
+    
+    Assigning the field drops the cached digest and hash, as Block.nonce
+    does for the block hash.
+    
+    Args:
+        name: Public field name; the value is stored in the '_' + name slot
+        doc: Property docstring
+        
+    Returns:
+        property: Field property
+    """
+    slot = '_' + name
+    
+    def fset(self, value):
+        setattr(self, slot, value)
+        self._digest = None
+        self._hash = None
+    
+    return property(attrgetter(slot), fset, doc=doc)
+
+class Transaction:
+    """
+    AetherChain Transaction class
+    
+    Represents a user command as a structured transaction with:
+    - Inputs: References to prior outputs
+    - Outputs: Intended states
+    - Metadata: Timestamp, public key signature, and nonce
+    """
+    
+    __slots__ = ('_inputs', '_outputs', '_timestamp', '_public_key', '_nonce', 'signature',
+                 '_digest', '_hash')
+    
+    # Fields covered by hash(); assigning one invalidates the cached hash
+    inputs = _hashed_field('inputs', "Input references (prior outputs)")
+    outputs = _hashed_field('outputs', "Intended output states")
+    timestamp = _hashed_field('timestamp', "Creation time in seconds since epoch")
+    public_key = _hashed_field('public_key', "Public key for signature verification")
+    nonce = _hashed_field('nonce', "Random 64-bit nonce")
+    
+    def __init__(self, inputs: Sequence[Union[TxIO, Dict]], outputs: Sequence[Union[TxIO, Dict]],
+                 public_key: bytes = None):
+        """
+        Initialize a new transaction
+        
+        Args:
+            inputs: Input references (prior outputs), as dicts or TxIO tuples
+            outputs: Intended output states, as dicts or TxIO tuples
+            public_key: Public key for signature verification
+        """
+        self._inputs = inputs
+        self._outputs = outputs
+        self._timestamp = time.time()
+        self._public_key = public_key
+        self._nonce = self._generate_nonce()
+        self.signature = None
+        self._digest = None  # cached digest(), computed on first use
+        self._hash = None  # cached hash(), hex form of the digest
+        
+    def _generate_nonce(self) -> int:
+        """
+        Generate a nonce for the transaction
+        
+        Returns:
+            int: A random 64-bit nonce value
+        """
+        import random
+        return random.randint(0, 2**64 - 1)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert transaction to dictionary representation
+        
+        Returns:
+            dict: Dictionary representation of the transaction
+        """
+        return {
+            'inputs': [_io_to_dict(entry) for entry in self.inputs],
+            'outputs': [_io_to_dict(entry) for entry in self.outputs],
+            'timestamp': self.timestamp,
+            'nonce': self.nonce,
+            'public_key': self.public_key.hex() if self.public_key else None,
+            'signature': self.signature.hex() if self.signature else None
+        }
+    
+    def serialize(self) -> str:
+        """
+        Serialize transaction to JSON string (without signature for signing)
+        
+        Returns:
+            str: JSON string representation
+        """
+        data = self.to_dict()
+        # Remove signature for signing
+        data['signature'] = None
+        return json.dumps(data, sort_keys=True)
+    
+    def canonical_bytes(self) -> bytes:
+        """
+        Encode the transaction (without signature) as canonical binary
+        
+        This is the message that is hashed and signed; serialize() stays the
+        human-readable JSON form. It is always built from the current contents,
+        so signatures are checked against what the transaction holds now.
+        
+        Layout: packed timestamp (float64) and nonce (uint64), the
+        length-prefixed public key, then the counted inputs and outputs.
+        
+        Returns:
+            bytes: Length-prefixed binary encoding of the transaction
+        """
+        public_key = self._public_key
+        parts = [
+            _HEADER.pack(self._timestamp, self._nonce),
+            _NO_KEY if public_key is None else _U32.pack(len(public_key)) + public_key,
+        ]
+        _encode_entries(self._inputs, parts)
+        _encode_entries(self._outputs, parts)
+        return b''.join(parts)
+    
+    def hash(self) -> str:
+        """
+        Calculate SHA-256 hash of the transaction
+        
+        The hash covers everything except the signature, so it is computed once
+        and cached. Assigning a field resets it; call invalidate_hash() after
+        changing an input/output in place.
+        
+        Returns:
+            str: Hexadecimal representation of the hash
+        """
+        if self._hash is None:
+            self._hash = self.digest().hex()
+        return self._hash
+    
+    def digest(self) -> bytes:
+        """
+        Get the raw 32-byte SHA-256 digest of the transaction
+        
+        Cached alongside hash(), and reset with it.
+        
+        Returns:
+            bytes: Digest behind hash()
+        """
+        if self._digest is None:
+            self._digest = hashlib.sha256(self.canonical_bytes()).digest()
+        return self._digest
+    
+    def invalidate_hash(self):
+        """
+        Drop the cached hash after an input/output was modified in place
+        """
+        self._digest = None
+        self._hash = None
+    
+    def sign(self, private_key: Union[PrivateKey, bytes]):
+        """
+        Sign the transaction with a private key using ECDSA (secp256k1)
+        
+        Args:
+            private_key: Loaded PrivateKey, or raw 32-byte secp256k1 private key
+        """
+        # Load private key unless the caller already holds one
+        if isinstance(private_key, PrivateKey):
+            private_key_obj = private_key
+        else:
+            private_key_obj = PrivateKey(private_key, context=GLOBAL_CONTEXT)
+        
+        self.sign_with(private_key_obj.sign)
+    
+    def sign_with(self, signer: Callable[[bytes], bytes]):
+        """
+        Sign the transaction with an already-bound ECDSA signer
+        
+        Args:
+            signer: Callable returning the DER-encoded secp256k1 signature of
+                the message it is given (e.g. a PrivateKey's bound sign method)
+        """
+        # Sign the data (SHA-256 digest, DER-encoded ECDSA signature)
+        self.signature = signer(self.canonical_bytes())
+    
+    def verify_signature(self) -> bool:
+        """
+        Verify the transaction signature
+        
+        Returns:
+            bool: True if signature is valid, False otherwise
+        """
+        if not self.signature or not self.public_key:
+            return False
+            
+        try:
+            # Load public key
+            public_key_obj = PublicKey(self.public_key, context=GLOBAL_CONTEXT)
+            
+            # Verify signature over the canonical encoding
+            return public_key_obj.verify(self.signature, self.canonical_bytes())
+        except ValueError:
+            return False
+
+# Example usage
+if __name__ == "__main__":
+    # Generate a key pair for testing
+    private_key = PrivateKey()
+    public_key = private_key.public_key
+    
+    # Serialize keys
+    private_key_bytes = private_key.secret
+    public_key_bytes = public_key.format(compressed=True)
+    
+    # Create a sample transaction
+    inputs = [
+        {
+            "tx_id": "abc123",
+            "output_index": 0,
+            "amount": 100
+        }
+    ]
+    
+    outputs = [
+        {
+            "address": "xyz789",
+            "amount": 50
+        },
+        {
+            "address": "def456",
+            "amount": 50
+        }
+    ]
+    
+    # Create transaction
+    tx = Transaction(inputs, outputs, public_key_bytes)
+    
+    # Sign transaction
+    tx.sign(private_key_bytes)
+    
+    # Verify signature
+    is_valid = tx.verify_signature()
+    print(f"Signature valid: {is_valid}")
+    
+    # Print transaction hash
+    print(f"Transaction hash: {tx.hash()}")
\ No newline at end of file
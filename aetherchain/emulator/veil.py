@@ -0,0 +1,314 @@
+"""
+AetherChain Emulator Veil Implementation
+
+Based on the AetherChain white paper, the Emulator Veil is:
+- A second layer of user-hosted virtual machines (e.g., WASM-based sandboxes)
+- Routes commands through air-gapped instances for privacy
+- Uses multi-party computation (MPC) for attestation
+- Preserves sacred data flows through commitments
+"""
+
+import hashlib
+import json
+import time
+import secrets
+from typing import List, Dict, Any, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.transaction import Transaction
+
+class EmulatorVeil:
+    """
+    AetherChain Emulator Veil class
+    
+    Implements the privacy and execution layer with:
+    - WASM-based sandboxing
+    - Air-gapped execution
+    - Multi-party computation (MPC) attestation
+    - Data commitment blinding
+    """
+    
+    def __init__(self, mpc_participants: int = 3):
+        """
+        Initialize the Emulator Veil
+        
+        Args:
+            mpc_participants: Number of participants in MPC attestation
+        """
+        self.mpc_participants = mpc_participants
+        self.active_emulators = {}
+        self.commitments = {}
+    
+    def create_commitment(self, transaction: Transaction) -> str:
+        """
+        Create a commitment to a transaction to preserve privacy
+        
+        According to the white paper:
+        "Privacy is paramount: Transactions reveal only commitments 
+        Commit(T) = H(T || r), blinding factor r"
+        
+        Args:
+            transaction: Transaction to commit to
+            
+        Returns:
+            str: Commitment hash
+        """
+        # Generate random blinding factor
+        blinding_factor = secrets.token_hex(32)
+        
+        # Create commitment: H(T || r)
+        commitment = self._commitment_hash(transaction, blinding_factor)
+        
+        # Store commitment
+        self.commitments[commitment] = {
+            'transaction': transaction,
+            'blinding_factor': blinding_factor,
+            'timestamp': time.time()
+        }
+        
+        return commitment
+    
+    def _commitment_hash(self, transaction: Transaction, blinding_factor: str) -> str:
+        """
+        Compute H(T || r) over the transaction's canonical encoding
+        
+        Args:
+            transaction: Transaction to commit to
+            blinding_factor: Hex blinding factor r
+            
+        Returns:
+            str: Commitment hash
+        """
+        return hashlib.sha256(transaction.canonical_bytes() + blinding_factor.encode()).hexdigest()
+    
+    def verify_commitment(self, commitment: str, transaction: Transaction) -> bool:
+        """
+        Verify that a commitment corresponds to a transaction
+        
+        Args:
+            commitment: Commitment hash to verify
+            transaction: Transaction to check against
+            
+        Returns:
+            bool: True if commitment is valid, False otherwise
+        """
+        if commitment not in self.commitments:
+            return False
+            
+        stored_data = self.commitments[commitment]
+        stored_transaction = stored_data['transaction']
+        blinding_factor = stored_data['blinding_factor']
+        
+        # Recreate commitment
+        expected_commitment = self._commitment_hash(stored_transaction, blinding_factor)
+        
+        return expected_commitment == commitment
+    
+    def initialize_emulator(self, emulator_id: str) -> Dict[str, Any]:
+        """
+        Initialize a WASM-based sandbox emulator
+        
+        Args:
+            emulator_id: Unique identifier for the emulator
+            
+        Returns:
+            dict: Emulator initialization data
+        """
+        # In a real implementation, this would:
+        # 1. Set up a WASM runtime environment
+        # 2. Configure security policies
+        # 3. Initialize air-gapped execution context
+        # 4. Set up MPC channels for attestation
+        
+        emulator_data = {
+            'id': emulator_id,
+            'type': 'wasm-sandbox',
+            'status': 'initialized',
+            'created_at': time.time(),
+            'security_level': 'air-gapped',
+            'mpc_enabled': True,
+            'memory_limit': '1GB',  # As mentioned in the white paper
+            'execution_timeout': 30  # seconds
+        }
+        
+        self.active_emulators[emulator_id] = emulator_data
+        return emulator_data
+    
+    def execute_in_veil(self, emulator_id: str, transaction: Transaction) -> Dict[str, Any]:
+        """
+        Execute a transaction within the Emulator Veil
+        
+        According to the white paper:
+        "Direct execution risks exposure; thus, AetherChain routes commands through the
+        Emulator Veil—a second layer of user-hosted virtual machines"
+        
+        Args:
+            emulator_id: ID of the emulator to use
+            transaction: Transaction to execute
+            
+        Returns:
+            dict: Execution result with MPC attestation
+        """
+        return self.commit_and_execute(emulator_id, transaction)[1]
+    
+    def commit_and_execute(self, emulator_id: str, transaction: Transaction) -> Tuple[str, Dict[str, Any]]:
+        """
+        Commit to a transaction and execute it within the Emulator Veil in one pass
+        
+        The commitment made for execution is the one returned, so callers that
+        need both do not commit to (and hash) the transaction twice.
+        
+        Args:
+            emulator_id: ID of the emulator to use
+            transaction: Transaction to execute
+            
+        Returns:
+            tuple: (commitment, execution result with MPC attestation)
+        """
+        # Check if emulator exists
+        if emulator_id not in self.active_emulators:
+            raise ValueError(f"Emulator {emulator_id} not found")
+            
+        # Create commitment for privacy
+        commitment = self.create_commitment(transaction)
+        
+        # Simulate execution in air-gapped instance
+        # In a real implementation, this would:
+        # 1. Load transaction into WASM sandbox
+        # 2. Execute in isolated environment
+        # 3. Capture outputs without exposing sensitive data
+        # 4. Generate attestation via MPC
+        
+        execution_result = {
+            'transaction_id': transaction.hash(),
+            'commitment': commitment,
+            'status': 'executed',
+            'output_commitments': [],  # Commitments to outputs, not actual outputs
+            'timestamp': time.time(),
+            'resources_used': {
+                'memory': '256MB',
+                'cpu_time': '0.5s'
+            }
+        }
+        
+        # Generate output commitments
+        for output in transaction.outputs:
+            output_data = json.dumps(output, sort_keys=True)
+            output_commitment = hashlib.sha256(
+                f"{output_data}{secrets.token_hex(16)}".encode()
+            ).hexdigest()
+            execution_result['output_commitments'].append(output_commitment)
+        
+        # Generate MPC attestation
+        mpc_attestation = self._generate_mpc_attestation(
+            emulator_id, transaction, execution_result
+        )
+        
+        execution_result['mpc_attestation'] = mpc_attestation
+        return commitment, execution_result
+    
+    def _generate_mpc_attestation(self, emulator_id: str, transaction: Transaction, 
+                                 execution_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate multi-party computation attestation for execution
+        
+        According to the white paper:
+        "Exchanges are emulated in air-gapped instances, with outputs attested 
+        via multi-party computation (MPC)"
+        
+        Args:
+            emulator_id: ID of the emulator
+            transaction: Executed transaction
+            execution_result: Result of execution
+            
+        Returns:
+            dict: MPC attestation data
+        """
+        # In a real implementation, this would:
+        # 1. Coordinate with multiple MPC participants
+        # 2. Each participant validates part of the computation
+        # 3. Combine partial signatures into aggregate signature
+        # 4. Generate zero-knowledge proof of correct execution
+        
+        # Simulate MPC attestation
+        mpc_data = {
+            'type': 'mpc-attestation',
+            'emulator_id': emulator_id,
+            'transaction_id': transaction.hash(),
+            'participants': self.mpc_participants,
+            'partial_signatures': [],
+            'aggregate_signature': 'simulated_aggregate_signature',
+            'zk_proof': 'zk_snark_proof_of_correct_execution',  # Would be actual ZK proof
+            'timestamp': time.time()
+        }
+        
+        # Generate simulated partial signatures from participants
+        for i in range(self.mpc_participants):
+            partial_sig = hashlib.sha256(
+                f"{emulator_id}{transaction.hash()}{i}{time.time()}".encode()
+            ).hexdigest()[:32]
+            mpc_data['partial_signatures'].append(partial_sig)
+            
+        return mpc_data
+    
+    def validate_attestation(self, attestation: Dict[str, Any]) -> bool:
+        """
+        Validate MPC attestation
+        
+        Args:
+            attestation: MPC attestation to validate
+            
+        Returns:
+            bool: True if attestation is valid, False otherwise
+        """
+        # In a real implementation, this would:
+        # 1. Verify each partial signature
+        # 2. Check aggregate signature
+        # 3. Validate ZK proof
+        
+        # For simulation, we just check if required fields exist
+        required_fields = ['type', 'transaction_id', 'aggregate_signature', 'zk_proof']
+        for field in required_fields:
+            if field not in attestation:
+                return False
+                
+        return attestation['type'] == 'mpc-attestation'
+
+# Example usage
+if __name__ == "__main__":
+    # Create Emulator Veil
+    veil = EmulatorVeil(mpc_participants=3)
+    
+    # Initialize an emulator
+    emulator = veil.initialize_emulator("emulator_001")
+    print(f"Initialized emulator: {emulator['id']}")
+    
+    # Create a sample transaction
+    tx = Transaction(
+        inputs=[{"tx_id": "input1", "output_index": 0, "amount": 100}],
+        outputs=[
+            {"address": "addr1", "amount": 50},
+            {"address": "addr2", "amount": 50}
+        ]
+    )
+    
+    print(f"Transaction hash: {tx.hash()}")
+    
+    # Create commitment for privacy
+    commitment = veil.create_commitment(tx)
+    print(f"Created commitment: {commitment}")
+    
+    # Verify commitment
+    is_valid = veil.verify_commitment(commitment, tx)
+    print(f"Commitment valid: {is_valid}")
+    
+    # Execute transaction in veil
+    result = veil.execute_in_veil("emulator_001", tx)
+    print(f"Execution status: {result['status']}")
+    print(f"Output commitments: {result['output_commitments']}")
+    
+    # Validate MPC attestation
+    is_attestation_valid = veil.validate_attestation(result['mpc_attestation'])
+    print(f"MPC attestation valid: {is_attestation_valid}")
\ No newline at end of file
@@ -0,0 +1,13 @@
+from setuptools import setup, find_packages
+
+setup(
+    name="aetherchain",
+    version="1.0.0",
+    packages=find_packages(),
+    install_requires=[
+        "coincurve>=15.0.0",
+    ],
+    author="AetherChain Team",
+    description="A decentralized operating system implementation based on the AetherChain white paper",
+    python_requires=">=3.6",
+)
\ No newline at end of file
@@ -0,0 +1,620 @@
+"""
+AetherChain Test Suite
+
+Comprehensive tests for all AetherChain components.
+"""
+
+import hashlib
+import json
+import struct
+import unittest
+
+from coincurve import PrivateKey
+
+# Use absolute imports
+from aetherchain.core.transaction import Transaction, TxIO
+from aetherchain.core.block import Block, compute_merkle_root
+from aetherchain.core.blockchain import Blockchain
+from aetherchain.consensus.proof_of_compute import ProofOfCompute
+from aetherchain.emulator.veil import EmulatorVeil
+from aetherchain.network.p2p_network import P2PNetworkNode
+from aetherchain.security.security_model import SecurityModel
+from aetherchain.wallet.digital_wallet import DigitalWallet
+from aetherchain.main import AetherChain
+
+class TestTransaction(unittest.TestCase):
+    """Test cases for Transaction class"""
+    
+    def setUp(self):
+        self.inputs = [{"tx_id": "input1", "output_index": 0, "amount": 100}]
+        self.outputs = [{"address": "addr1", "amount": 100}]
+        self.transaction = Transaction(self.inputs, self.outputs)
+    
+    def test_transaction_creation(self):
+        """Test transaction creation"""
+        self.assertIsNotNone(self.transaction)
+        self.assertEqual(self.transaction.inputs, self.inputs)
+        self.assertEqual(self.transaction.outputs, self.outputs)
+        self.assertIsNotNone(self.transaction.timestamp)
+        self.assertIsNotNone(self.transaction.nonce)
+    
+    def test_transaction_hash(self):
+        """Test transaction hashing"""
+        hash1 = self.transaction.hash()
+        hash2 = self.transaction.hash()
+        self.assertEqual(hash1, hash2)  # Hash should be consistent
+        self.assertEqual(self.transaction.digest().hex(), hash1)
+        
+        # Assigning a field drops the cached hash
+        self.transaction.outputs = [{"address": "addr2", "amount": 100}]
+        self.assertNotEqual(self.transaction.hash(), hash1)
+        hash2 = self.transaction.hash()
+        self.transaction.nonce += 1
+        self.assertNotEqual(self.transaction.hash(), hash2)
+        self.assertEqual(self.transaction.digest(),
+                         hashlib.sha256(self.transaction.canonical_bytes()).digest())
+    
+    def test_canonical_bytes(self):
+        """Test canonical binary encoding used for hashing"""
+        encoded = self.transaction.canonical_bytes()
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(encoded, self.transaction.canonical_bytes())
+        
+        # Key order in the input/output dicts does not affect the encoding
+        self.transaction.outputs = [dict(reversed(list(self.outputs[0].items())))]
+        self.assertEqual(self.transaction.canonical_bytes(), encoded)
+        
+        # Timestamp and nonce lead as a packed header; the nonce is unsigned 64-bit
+        self.transaction.nonce = 2**64 - 1
+        header = struct.pack('<dQ', self.transaction.timestamp, 2**64 - 1)
+        self.assertTrue(self.transaction.canonical_bytes().startswith(header))
+    
+    def test_tampered_signature_fails(self):
+        """Test a signed transaction fails verification once its contents change"""
+        private_key = PrivateKey()
+        tx = Transaction(self.inputs, [{"address": "addr1", "amount": 100}],
+                         private_key.public_key.format(compressed=True))
+        tx.hash()
+        tx.sign(private_key)
+        self.assertTrue(tx.verify_signature())
+        
+        tx.outputs[0]['amount'] = 1e9
+        self.assertFalse(tx.verify_signature())
+    
+    def test_txio_field_lookup(self):
+        """Test TxIO name lookup only reaches its fields"""
+        entry = TxIO("addr1", 100, "AETH")
+        self.assertEqual(entry['amount'], 100)
+        self.assertEqual(entry.get('address'), "addr1")
+        self.assertEqual(entry[2], "AETH")
+        
+        # Tuple attributes are not fields
+        self.assertIsNone(entry.get('count'))
+        self.assertEqual(entry.get('_asdict', 0), 0)
+        with self.assertRaises(KeyError):
+            entry['index']
+        
+        # Encoded field by field, exactly like the equivalent dict
+        as_tuple = Transaction([], [entry])
+        as_dict = Transaction([], [entry._asdict()])
+        as_dict.timestamp, as_dict.nonce = as_tuple.timestamp, as_tuple.nonce
+        self.assertEqual(as_tuple.canonical_bytes(), as_dict.canonical_bytes())
+    
+    def test_transaction_serialization(self):
+        """Test transaction serialization"""
+        serialized = self.transaction.serialize()
+        self.assertIsInstance(serialized, str)
+        self.assertIn('"inputs"', serialized)
+        self.assertIn('"outputs"', serialized)
+
+class TestBlock(unittest.TestCase):
+    """Test cases for Block class"""
+    
+    def setUp(self):
+        self.transactions = [
+            Transaction(
+                [{"tx_id": "input1", "output_index": 0, "amount": 100}],
+                [{"address": "addr1", "amount": 100}]
+            )
+        ]
+        self.block = Block(1, self.transactions, "0" * 64)
+    
+    def test_block_creation(self):
+        """Test block creation"""
+        self.assertEqual(self.block.index, 1)
+        self.assertEqual(self.block.transactions, self.transactions)
+        self.assertEqual(self.block.previous_hash, "0" * 64)
+    
+    def test_merkle_root_calculation(self):
+        """Test Merkle root calculation"""
+        merkle_root = self.block.merkle_root
+        self.assertIsNotNone(merkle_root)
+        self.assertIsInstance(merkle_root, str)
+        self.assertEqual(merkle_root, self.transactions[0].hash())
+        
+        # Pairs are combined as raw digests, not hex strings
+        tx2 = Transaction([], [{"address": "addr2", "amount": 50}])
+        block = Block(2, self.transactions + [tx2], "0" * 64)
+        expected = hashlib.sha256(self.transactions[0].digest() + tx2.digest()).hexdigest()
+        self.assertEqual(block.merkle_root, expected)
+    
+    def test_block_hash(self):
+        """Test block hashing"""
+        block_hash = self.block.hash()
+        self.assertIsNotNone(block_hash)
+        self.assertIsInstance(block_hash, str)
+        self.assertEqual(len(block_hash), 64)  # SHA-256 hash length
+    
+    def test_block_mining(self):
+        """Test mined nonce gives a header hash meeting the difficulty"""
+        self.block.mine_block(difficulty=2)
+        self.assertTrue(self.block.hash().startswith("00"))
+        self.assertEqual(self.block.proof_of_compute['nonce'], self.block.nonce)
+    
+    def test_block_hash_tracks_nonce(self):
+        """Test cached block hash is refreshed when the nonce changes"""
+        hash1 = self.block.hash()
+        self.block.nonce += 1
+        self.assertNotEqual(self.block.hash(), hash1)
+
+class TestBlockchain(unittest.TestCase):
+    """Test cases for Blockchain class"""
+    
+    def setUp(self):
+        self.blockchain = Blockchain(difficulty=1)  # Low difficulty for testing
+    
+    def test_genesis_block(self):
+        """Test genesis block creation"""
+        self.assertEqual(len(self.blockchain.chain), 1)
+        self.assertEqual(self.blockchain.chain[0].index, 0)
+        self.assertEqual(self.blockchain.chain[0].previous_hash, "0" * 64)
+    
+    def test_transaction_addition(self):
+        """Test adding transactions to mempool"""
+        tx = Transaction(
+            [{"tx_id": "input1", "output_index": 0, "amount": 100}],
+            [{"address": "addr1", "amount": 100}]
+        )
+        
+        result = self.blockchain.add_transaction(tx)
+        self.assertTrue(result)
+        self.assertEqual(len(self.blockchain.pending_transactions), 1)
+        self.assertIn(tx, self.blockchain.pending_transactions)
+        
+        # The same transaction is only pooled once
+        self.assertFalse(self.blockchain.add_transaction(tx))
+        self.assertEqual(len(self.blockchain.pending_transactions), 1)
+    
+    def test_mempool_merkle_root(self):
+        """Test the mempool's cached Merkle root tracks added transactions"""
+        pool = self.blockchain.pending_transactions
+        for i in range(13):
+            self.blockchain.add_transaction(Transaction([], [{"address": f"addr{i}", "amount": i}]))
+            self.assertEqual(pool.merkle_root(), compute_merkle_root(pool.hashes))
+    
+    def test_block_mining(self):
+        """Test block mining"""
+        # Add a transaction
+        tx = Transaction(
+            [{"tx_id": "input1", "output_index": 0, "amount": 100}],
+            [{"address": "addr1", "amount": 100}]
+        )
+        self.blockchain.add_transaction(tx)
+        
+        # Mine a block
+        block = self.blockchain.mine_pending_transactions("miner_addr")
+        self.assertIsNotNone(block)
+        self.assertEqual(len(self.blockchain.chain), 2)  # Genesis + new block
+        self.assertEqual(self.blockchain.height, 2)
+        self.assertEqual(block.index, 1)
+        self.assertEqual(len(self.blockchain.pending_transactions), 0)
+        self.assertEqual(block.merkle_root, block._calculate_merkle_root())
+    
+    def test_tampered_chain_invalid(self):
+        """Test edits to a mined block's header fields invalidate the chain"""
+        self.blockchain.add_transaction(Transaction([], [{"address": "addr1", "amount": 100}]))
+        self.blockchain.mine_pending_transactions("miner_addr")
+        self.assertTrue(self.blockchain.is_chain_valid())
+        
+        block = self.blockchain.chain[1]
+        block.merkle_root = '00' * 32
+        block.timestamp = 0
+        self.assertFalse(self.blockchain.is_chain_valid())
+
+class TestProofOfCompute(unittest.TestCase):
+    """Test cases for ProofOfCompute class"""
+    
+    def setUp(self):
+        self.poc = ProofOfCompute(initial_difficulty=1)
+    
+    def test_target_calculation(self):
+        """Test target calculation"""
+        target = self.poc.calculate_target()
+        self.assertEqual(target, "0" * self.poc.difficulty)
+        
+        # The integer target accepts exactly the hashes with that zero prefix
+        target_int = self.poc.calculate_target_int()
+        self.assertLess(int("0" + "f" * 63, 16), target_int)
+        self.assertGreaterEqual(int("1" + "0" * 63, 16), target_int)
+    
+    def test_puzzle_solving(self):
+        """Test puzzle solving"""
+        block_header = "test_header"
+        nonce, hash_result = self.poc.solve_puzzle(block_header)
+        self.assertIsInstance(nonce, int)
+        self.assertIsInstance(hash_result, str)
+        
+        # Verify the hash meets the target
+        target = self.poc.calculate_target()
+        self.assertLessEqual(hash_result[:len(target)], target)
+    
+    def test_difficulty_adjustment(self):
+        """Test difficulty adjustment"""
+        initial_difficulty = self.poc.difficulty
+        
+        # Simulate block times (1 block per 30 seconds, faster than target of 60)
+        block_times = [i * 30 for i in range(10)]
+        new_difficulty = self.poc.adjust_difficulty(block_times)
+        
+        # Difficulty should increase since blocks are coming too fast
+        self.assertGreaterEqual(new_difficulty, initial_difficulty)
+
+class TestEmulatorVeil(unittest.TestCase):
+    """Test cases for EmulatorVeil class"""
+    
+    def setUp(self):
+        self.veil = EmulatorVeil()
+    
+    def test_emulator_initialization(self):
+        """Test emulator initialization"""
+        emulator = self.veil.initialize_emulator("test_emulator")
+        self.assertEqual(emulator['id'], "test_emulator")
+        self.assertEqual(emulator['type'], "wasm-sandbox")
+        self.assertEqual(emulator['status'], "initialized")
+    
+    def test_commitment_creation(self):
+        """Test commitment creation"""
+        tx = Transaction(
+            [{"tx_id": "input1", "output_index": 0, "amount": 100}],
+            [{"address": "addr1", "amount": 100}]
+        )
+        
+        commitment = self.veil.create_commitment(tx)
+        self.assertIsNotNone(commitment)
+        self.assertIsInstance(commitment, str)
+        self.assertEqual(len(commitment), 64)  # SHA-256 hash length
+    
+    def test_commitment_verification(self):
+        """Test commitment verification"""
+        tx = Transaction(
+            [{"tx_id": "input1", "output_index": 0, "amount": 100}],
+            [{"address": "addr1", "amount": 100}]
+        )
+        
+        commitment = self.veil.create_commitment(tx)
+        is_valid = self.veil.verify_commitment(commitment, tx)
+        self.assertTrue(is_valid)
+    
+    def test_commit_and_execute(self):
+        """Test fused commitment and execution share one commitment"""
+        self.veil.initialize_emulator("test_emulator")
+        tx = Transaction([{"tx_id": "input1"}], [{"address": "addr1", "amount": 100}])
+        
+        commitment, result = self.veil.commit_and_execute("test_emulator", tx)
+        self.assertEqual(result['commitment'], commitment)
+        self.assertEqual(result['status'], 'executed')
+        self.assertTrue(self.veil.verify_commitment(commitment, tx))
+        self.assertEqual(len(self.veil.commitments), 1)
+
+class TestP2PNetwork(unittest.TestCase):
+    """Test cases for P2PNetworkNode class"""
+    
+    def setUp(self):
+        self.node = P2PNetworkNode("test_node")
+    
+    def test_node_creation(self):
+        """Test node creation"""
+        self.assertEqual(self.node.node_id, "test_node")
+        self.assertEqual(self.node.host, "127.0.0.1")
+        self.assertEqual(self.node.port, 8000)
+    
+    def test_peer_management(self):
+        """Test peer management"""
+        # Add a peer
+        self.node.add_peer("peer1", "127.0.0.1", 8001)
+        self.assertIn("peer1", self.node.peers)
+        
+        # Remove a peer
+        self.node.remove_peer("peer1")
+        self.assertNotIn("peer1", self.node.peers)
+    
+    def test_network_status(self):
+        """Test network status"""
+        status = self.node.get_network_status()
+        self.assertIsInstance(status, dict)
+        self.assertEqual(status['node_id'], "test_node")
+        self.assertEqual(status['is_running'], False)
+    
+    def test_batched_broadcast(self):
+        """Test broadcasts are queued and sent together by flush"""
+        tx1 = Transaction([{"tx_id": "input1"}], [{"address": "addr1", "amount": 100}])
+        tx2 = Transaction([{"tx_id": "input2"}], [{"address": "addr2", "amount": 50}])
+        self.node.broadcast_transaction(tx1)
+        self.node.broadcast_transaction(tx2)
+        self.node.broadcast_transaction(tx1)  # Already known, not queued again
+        
+        # Nothing is sent without peers
+        self.assertEqual(self.node.flush(), 0)
+        
+        self.node.add_peer("peer1", "127.0.0.1", 8001)
+        self.node.broadcast_transaction(Transaction([{"tx_id": "input3"}], []))
+        self.assertEqual(self.node.flush(), 1)
+        self.assertEqual(self.node.flush(), 0)
+    
+    def test_relayed_frame_is_signed(self):
+        """Test relayed transactions keep their signature on the wire"""
+        frames = []
+        self.node._send = lambda peer_id, frame: frames.append(frame)
+        self.node.add_peer("peer1", "127.0.0.1", 8001)
+        
+        private_key = PrivateKey()
+        tx = Transaction([{"tx_id": "input1"}], [{"address": "addr1", "amount": 100}],
+                         private_key.public_key.format(compressed=True))
+        tx.sign(private_key)
+        
+        # Relayed from the receive path without an explicit flush()
+        self.assertTrue(self.node.handle_incoming_transaction(tx))
+        self.assertEqual(len(frames), 1)
+        
+        message = json.loads(frames[0].splitlines()[0])
+        self.assertEqual(message['signature'], tx.signature.hex())
+
+class TestSecurityModel(unittest.TestCase):
+    """Test cases for SecurityModel class"""
+    
+    def setUp(self):
+        self.blockchain = Blockchain()
+        self.security = SecurityModel(self.blockchain)
+    
+    def test_double_execution_prevention(self):
+        """Test double-execution prevention"""
+        tx = Transaction(
+            [{"tx_id": "input1", "output_index": 0, "amount": 100}],
+            [{"address": "addr1", "amount": 100}]
+        )
+        
+        # First execution should be allowed
+        result1 = self.security.prevent_double_execution(tx)
+        self.assertTrue(result1)
+        
+        # Second execution should be blocked
+        result2 = self.security.prevent_double_execution(tx)
+        self.assertFalse(result2)
+    
+    def test_attack_probability_calculation(self):
+        """Test attack probability calculation"""
+        # Test with 45% attacker hash power and 6 confirmations
+        prob = self.security.calculate_attack_probability(0.45, 6)
+        self.assertIsInstance(prob, float)
+        self.assertGreaterEqual(prob, 0.0)
+        self.assertLessEqual(prob, 1.0)
+    
+    def test_fork_safety(self):
+        """Test fork safety"""
+        is_safe = self.security.is_fork_safe(10, 0.45)
+        self.assertIsInstance(is_safe, bool)
+
+class TestDigitalWallet(unittest.TestCase):
+    """Test cases for DigitalWallet class"""
+    
+    def setUp(self):
+        self.wallet = DigitalWallet("test_wallet")
+    
+    def test_wallet_creation(self):
+        """Test wallet creation"""
+        self.assertEqual(self.wallet.wallet_id, "test_wallet")
+        self.assertIsNotNone(self.wallet.address)
+        self.assertIsNotNone(self.wallet.private_key)
+        self.assertIsNotNone(self.wallet.public_key)
+        self.assertEqual(list(self.wallet.supported_currencies), ['AETH', 'BTC', 'ETH', 'USDC'])
+        self.assertEqual(self.wallet.to_dict()['supported_currencies'], ('AETH', 'BTC', 'ETH', 'USDC'))
+        self.assertIn('"supported_currencies": ["AETH", "BTC", "ETH", "USDC"]', json.dumps(self.wallet.to_dict()))
+    
+    def test_balance_operations(self):
+        """Test balance operations"""
+        # Initial balance should be 0
+        self.assertEqual(self.wallet.get_balance('AETH'), 0.0)
+        
+        # Deposit funds
+        self.wallet.deposit(100.0, 'AETH')
+        self.assertEqual(self.wallet.get_balance('AETH'), 100.0)
+        
+        # Withdraw funds
+        result = self.wallet.withdraw(50.0, 'AETH')
+        self.assertTrue(result)
+        self.assertEqual(self.wallet.get_balance('AETH'), 50.0)
+        
+        # Attempt to withdraw more than balance
+        result = self.wallet.withdraw(100.0, 'AETH')
+        self.assertFalse(result)  # Should fail
+        self.assertEqual(self.wallet.get_balance('AETH'), 50.0)  # Balance unchanged
+    
+    def test_lazy_keypair(self):
+        """Test key pair is generated on first use and backs the address"""
+        self.assertIsNone(self.wallet._private_key)
+        
+        # Address is derived from the public key, not random
+        address = self.wallet.get_address()
+        public_key = self.wallet._get_public_key_bytes()
+        self.assertEqual(address, hashlib.sha256(public_key).digest()[:20].hex())
+        self.assertEqual(self.wallet.get_address(), address)
+    
+    def test_signer(self):
+        """Test the wallet signer signs for the wallet public key"""
+        transaction = Transaction([], [{"address": "addr1", "amount": 1}],
+                                  self.wallet._get_public_key_bytes())
+        transaction.sign_with(self.wallet.signer())
+        self.assertTrue(transaction.verify_signature())
+    
+    def test_balances_view(self):
+        """Test read-only balances view"""
+        balances = self.wallet.get_balances()
+        self.assertEqual(balances['AETH'], 0.0)
+        with self.assertRaises(TypeError):
+            balances['AETH'] = 1.0
+        
+        # View is rebuilt after a balance change
+        self.wallet.deposit(10.0, 'BTC')
+        self.assertEqual(self.wallet.get_balances()['BTC'], 10.0)
+    
+    def test_transaction_creation(self):
+        """Test transaction creation"""
+        # Deposit some funds first
+        self.wallet.deposit(100.0, 'AETH')
+        
+        # Create a transaction
+        recipient_address = "recipient_addr"
+        transaction = self.wallet.create_transaction(recipient_address, 25.0, 'AETH')
+        
+        self.assertIsNotNone(transaction)
+        self.assertEqual(len(transaction.inputs), 1)
+        self.assertEqual(len(transaction.outputs), 2)  # Recipient + fee
+    
+    def test_batch_payments(self):
+        """Test batched compute payments"""
+        self.wallet.deposit(1.0, 'AETH')
+        
+        payments = self.wallet.facilitate_payments_batch(
+            ["node_a", "node_b"], [100, 200], kind='compute'
+        )
+        self.assertEqual(len(payments), 2)
+        self.assertEqual(payments[1].outputs[0]['address'], "node_b")
+        self.assertAlmostEqual(payments[1].outputs[0]['amount'], 0.2)
+        
+        # Batch exceeding the balance is rejected before signing anything
+        with self.assertRaises(ValueError):
+            self.wallet.facilitate_payments_batch(["node_a"], [100.0], kind='storage')
+        self.assertEqual(len(list(self.wallet.get_transaction_history())), 3)
+    
+    def test_transaction_history(self):
+        """Test transaction history records"""
+        self.wallet.deposit(100.0, 'AETH')
+        transaction = self.wallet.create_transaction("recipient_addr", 25.0, 'AETH')
+        
+        history = list(self.wallet.get_transaction_history())
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history[0].type, 'deposit')
+        self.assertNotIn('fee', history[0].to_dict())  # Only set on transfers
+        self.assertEqual(history[1].type, 'transfer')
+        self.assertEqual(history[1].recipient, "recipient_addr")
+        self.assertEqual(history[1].transaction_id, transaction.hash())
+        
+        # Paged reads
+        page = list(self.wallet.get_transaction_history(start=1, limit=5))
+        self.assertEqual([record.type for record in page], ['transfer'])
+
+class TestAetherChain(unittest.TestCase):
+    """Test cases for AetherChain main class"""
+    
+    def setUp(self):
+        self.aetherchain = AetherChain("test_node")
+    
+    def test_aetherchain_creation(self):
+        """Test AetherChain creation"""
+        self.assertEqual(self.aetherchain.node_id, "test_node")
+        self.assertFalse(self.aetherchain.is_running)
+        
+        # Check that all components are initialized
+        self.assertIsNotNone(self.aetherchain.blockchain)
+        self.assertIsNotNone(self.aetherchain.proof_of_compute)
+        self.assertIsNotNone(self.aetherchain.emulator_veil)
+        self.assertIsNotNone(self.aetherchain.network)
+        self.assertIsNotNone(self.aetherchain.security)
+        self.assertIsNotNone(self.aetherchain.wallet)
+    
+    def test_system_lifecycle(self):
+        """Test system start/stop lifecycle"""
+        # Start the system
+        self.aetherchain.start()
+        self.assertTrue(self.aetherchain.is_running)
+        
+        # Get system status
+        status = self.aetherchain.get_system_status()
+        self.assertIsInstance(status, dict)
+        self.assertTrue(status['is_running'])
+        self.assertIsInstance(status['timestamp'], float)
+        json.dumps(status)  # Status must stay JSON-serializable
+        
+        # Stop the system
+        self.aetherchain.stop()
+        self.assertFalse(self.aetherchain.is_running)
+    
+    def test_transaction_signing(self):
+        """Test command transactions are signed with the node's wallet key"""
+        tx = self.aetherchain.create_transaction("allocate 1GB memory for process P", {'memory': 1024})
+        self.assertEqual(tx.public_key, self.aetherchain.wallet._get_public_key_bytes())
+        self.assertTrue(tx.verify_signature())
+    
+    def test_command_dispatch(self):
+        """Test commands are parsed by their leading verb"""
+        tx = self.aetherchain.create_transaction(
+            "exchange data shard D with node N", {'data_shard': 'shard_D', 'node': 'node_N'})
+        self.assertEqual(tx.inputs[0]['target_node'], 'node_N')
+        self.assertEqual(tx.outputs[0]['type'], 'data_exchange')
+        
+        tx = self.aetherchain.create_transaction("start network service", {'port': 8080})
+        self.assertEqual(tx.inputs, [])
+        self.assertEqual(tx.outputs, [])
+    
+    def test_command_execution(self):
+        """Test command execution"""
+        # Start the system first
+        self.aetherchain.start()
+        
+        # Execute a command
+        result = self.aetherchain.execute_command(
+            "allocate 1GB memory for process P",
+            {'memory': 1024}
+        )
+        
+        self.assertIsNotNone(result)
+        self.assertEqual(result['status'], 'success')
+        self.assertIn('transaction_id', result)
+        self.assertIn('commitment', result)
+        
+        # Stop the system
+        self.aetherchain.stop()
+
+def run_tests():
+    """Run all tests"""
+    # Create test suite
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    
+    # Add all test cases
+    suite.addTests(loader.loadTestsFromTestCase(TestTransaction))
+    suite.addTests(loader.loadTestsFromTestCase(TestBlock))
+    suite.addTests(loader.loadTestsFromTestCase(TestBlockchain))
+    suite.addTests(loader.loadTestsFromTestCase(TestProofOfCompute))
+    suite.addTests(loader.loadTestsFromTestCase(TestEmulatorVeil))
+    suite.addTests(loader.loadTestsFromTestCase(TestP2PNetwork))
+    suite.addTests(loader.loadTestsFromTestCase(TestSecurityModel))
+    suite.addTests(loader.loadTestsFromTestCase(TestDigitalWallet))
+    suite.addTests(loader.loadTestsFromTestCase(TestAetherChain))
+    
+    # Run tests
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    
+    return result.wasSuccessful()
+
+if __name__ == "__main__":
+    print("Running AetherChain Test Suite...")
+    success = run_tests()
+    
+    if success:
+        print("\nAll tests passed! AetherChain implementation is working correctly.")
+    else:
+        print("\nSome tests failed. Please check the implementation.")
+    
+    sys.exit(0 if success else 1)
\ No newline at end of file
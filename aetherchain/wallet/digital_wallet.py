@@ -0,0 +1,669 @@
+"""
+AetherChain Digital Wallet Implementation
+
+Based on the AetherChain white paper, the wallet system:
+- Facilitates payments for contributing compute and storage
+- Supports external cryptocurrencies
+- Enables monetization of sacred human data
+- Integrates with the blockchain for seamless transactions
+"""
+
+import hashlib
+import json
+import logging
+import time
+from itertools import islice
+from operator import attrgetter
+from types import MappingProxyType
+from typing import List, Dict, Any, Callable, Iterator, Mapping
+from coincurve import GLOBAL_CONTEXT, PrivateKey, PublicKey
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.transaction import Transaction, TxIO
+
+logger = logging.getLogger(__name__)
+
+# secp256k1 context shared by every wallet's keys
+_CTX = GLOBAL_CONTEXT
+
+# Currency codes, interned so balance-index lookups hit the identity fast path
+AETH = sys.intern('AETH')  # AetherChain native
+BTC = sys.intern('BTC')
+ETH = sys.intern('ETH')
+USDC = sys.intern('USDC')
+
+# Supported currencies in balance-slot order
+SUPPORTED_CURRENCIES = (AETH, BTC, ETH, USDC)
+
+class TxnRecord:
+    """
+    Wallet transaction history record
+    
+    Fixed-schema entry for deposits, withdrawals, transfers and receipts.
+    Fields that do not apply to a record type are left as None.
+    """
+    
+    __slots__ = ('type', 'amount', 'currency', 'timestamp', 'balance_after',
+                 'fee', 'recipient', 'sender', 'transaction_id')
+    
+    # Fetches every field as one tuple
+    _field_values = attrgetter(*__slots__)
+    
+    def __init__(self, type: str, amount: float, currency: str, timestamp: float,
+                 balance_after: float, fee: float = None, recipient: str = None,
+                 sender: bytes = None, transaction_id: str = None):
+        """
+        Initialize a transaction history record
+        
+        Args:
+            type: Record type (deposit, withdrawal, transfer, receive)
+            amount: Amount moved
+            currency: Currency of the amount
+            timestamp: Time of the operation
+            balance_after: Balance of the currency after the operation
+            fee: Transaction fee (transfers only)
+            recipient: Recipient address (transfers only)
+            sender: Sender public key (receipts only)
+            transaction_id: Hash of the underlying transaction
+        """
+        self.type = type
+        self.amount = amount
+        self.currency = currency
+        self.timestamp = timestamp
+        self.balance_after = balance_after
+        self.fee = fee
+        self.recipient = recipient
+        self.sender = sender
+        self.transaction_id = transaction_id
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert record to dictionary representation
+        
+        Returns:
+            dict: Record data, omitting fields that do not apply
+        """
+        return {
+            field: value for field, value in zip(self.__slots__, self._field_values(self))
+            if value is not None
+        }
+
+class DigitalWallet:
+    """
+    AetherChain Digital Wallet class
+    
+    Implements the wallet system with:
+    - Multi-currency support
+    - Secure key management
+    - Transaction creation and signing
+    - Balance tracking
+    - Payment facilitation for compute/storage
+    """
+    
+    # Supported currencies, kept under the former per-wallet attribute name
+    supported_currencies = SUPPORTED_CURRENCIES
+    
+    # Slot of each supported currency in the balances list
+    _CURRENCY_INDEX = {currency: idx for idx, currency in enumerate(SUPPORTED_CURRENCIES)}
+    
+    # Default per-unit prices for batched resource payments
+    _DEFAULT_UNIT_PRICES = {'compute': 0.001, 'storage': 0.01}
+    
+    # Current time in seconds since epoch, bound once for the record-keeping paths
+    _now = staticmethod(time.time)
+    
+    def __init__(self, wallet_id: str):
+        """
+        Initialize a digital wallet
+        
+        Args:
+            wallet_id: Unique identifier for the wallet
+        """
+        self.wallet_id = wallet_id
+        self.balances: List[float] = [0.0] * len(SUPPORTED_CURRENCIES)  # indexed by _CURRENCY_INDEX
+        self._balances_view = None  # cached get_balances() result, reset on every balance change
+        self._private_key = None
+        self._public_key = None
+        self._priv_bytes = None
+        self._pub_bytes = None
+        self._sign = None  # bound signing method of the private key
+        self._address = None  # derived from the public key on first access
+        self.transaction_history: List[TxnRecord] = []
+    
+    @property
+    def address(self) -> str:
+        """
+        Wallet address, derived from the public key on first access
+        
+        Returns:
+            str: First 20 bytes of the SHA-256 of the compressed public key, as hex
+        """
+        if self._address is None:
+            self._address = hashlib.sha256(self._get_public_key_bytes()).digest()[:20].hex()
+        return self._address
+    
+    @property
+    def private_key(self) -> PrivateKey:
+        """
+        Wallet private key, generated on first access
+        
+        Returns:
+            PrivateKey: secp256k1 private key
+        """
+        if self._private_key is None:
+            self._generate_keypair()
+        return self._private_key
+    
+    @property
+    def public_key(self) -> PublicKey:
+        """
+        Wallet public key, generated on first access
+        
+        Returns:
+            PublicKey: secp256k1 public key
+        """
+        if self._public_key is None:
+            self._generate_keypair()
+        return self._public_key
+    
+    def _generate_keypair(self):
+        """
+        Generate a key pair for the wallet
+        """
+        # Generate private key using secp256k1 curve (as in Bitcoin) via libsecp256k1
+        self._private_key = PrivateKey(context=_CTX)
+        self._public_key = self._private_key.public_key
+        
+        # Serialize keys once; they are reused for every transaction
+        self._priv_bytes = self._private_key.secret
+        self._pub_bytes = self._public_key.format(compressed=True)
+        
+        # Bind the signer once so transactions are signed without per-call lookups
+        self._sign = self._private_key.sign
+    
+    def signer(self) -> Callable[[bytes], bytes]:
+        """
+        Get the wallet's bound ECDSA signer, generating the key pair if needed
+        
+        Returns:
+            Callable: Signs a message, returning a DER-encoded secp256k1
+                signature (for Transaction.sign_with)
+        """
+        if self._sign is None:
+            self._generate_keypair()
+        return self._sign
+    
+    def get_address(self) -> str:
+        """
+        Get the wallet address
+        
+        Returns:
+            str: Wallet address
+        """
+        return self.address
+    
+    def get_balance(self, currency: str = AETH) -> float:
+        """
+        Get the balance for a specific currency
+        
+        Args:
+            currency: Currency to check balance for
+            
+        Returns:
+            float: Balance amount
+        """
+        idx = self._CURRENCY_INDEX.get(currency)
+        if idx is None:
+            return 0.0
+        return self.balances[idx]
+    
+    def get_balances(self) -> Mapping[str, float]:
+        """
+        Get all balances
+        
+        The mapping is built once per balance change and shared between
+        callers; use dict() on it to get a mutable copy.
+        
+        Returns:
+            Mapping: Read-only view of all currency balances
+        """
+        if self._balances_view is None:
+            self._balances_view = MappingProxyType(dict(zip(SUPPORTED_CURRENCIES, self.balances)))
+        return self._balances_view
+    
+    def deposit(self, amount: float, currency: str = AETH):
+        """
+        Deposit funds into the wallet
+        
+        Args:
+            amount: Amount to deposit
+            currency: Currency to deposit
+        """
+        idx = self._CURRENCY_INDEX.get(currency)
+        if idx is None:
+            raise ValueError(f"Unsupported currency: {currency}")
+            
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive")
+            
+        balance = self.balances[idx] + amount
+        self.balances[idx] = balance
+        self._balances_view = None
+        
+        # Record transaction
+        self.transaction_history.append(TxnRecord(
+            type='deposit',
+            amount=amount,
+            currency=currency,
+            timestamp=self._now(),
+            balance_after=balance
+        ))
+        
+        logger.debug("Deposited %s %s to wallet %s", amount, currency, self.wallet_id)
+    
+    def withdraw(self, amount: float, currency: str = AETH) -> bool:
+        """
+        Withdraw funds from the wallet
+        
+        Args:
+            amount: Amount to withdraw
+            currency: Currency to withdraw
+            
+        Returns:
+            bool: True if withdrawal successful, False otherwise
+        """
+        idx = self._CURRENCY_INDEX.get(currency)
+        if idx is None:
+            raise ValueError(f"Unsupported currency: {currency}")
+            
+        if amount <= 0:
+            raise ValueError("Withdrawal amount must be positive")
+            
+        balance = self.balances[idx]
+        if balance < amount:
+            logger.warning("Insufficient balance for withdrawal: %s < %s", balance, amount)
+            return False
+            
+        balance -= amount
+        self.balances[idx] = balance
+        self._balances_view = None
+        
+        # Record transaction
+        self.transaction_history.append(TxnRecord(
+            type='withdrawal',
+            amount=amount,
+            currency=currency,
+            timestamp=self._now(),
+            balance_after=balance
+        ))
+        
+        logger.debug("Withdrew %s %s from wallet %s", amount, currency, self.wallet_id)
+        return True
+    
+    def create_transaction(self, recipient_address: str, amount: float, 
+                          currency: str = AETH, fee: float = 0.0001) -> Transaction:
+        """
+        Create a transaction for sending funds
+        
+        According to the white paper:
+        "Incentives: Block proposers facilitate transaction fees (0.01% of data value) 
+        via built-in digital currency wallets, promoting participation through external 
+        cryptocurrency payments"
+        
+        Args:
+            recipient_address: Recipient's wallet address
+            amount: Amount to send
+            currency: Currency to send
+            fee: Transaction fee (0.01% of data value as mentioned in white paper)
+            
+        Returns:
+            Transaction: Created transaction object
+        """
+        idx = self._CURRENCY_INDEX.get(currency)
+        if idx is None:
+            raise ValueError(f"Unsupported currency: {currency}")
+            
+        total_amount = amount + fee
+        
+        balance = self.balances[idx]
+        if balance < total_amount:
+            raise ValueError(f"Insufficient balance: {balance} < {total_amount}")
+            
+        # Create transaction inputs and outputs
+        inputs = (TxIO(self.address, total_amount, currency),)
+        
+        outputs = (
+            TxIO(recipient_address, amount, currency),
+            TxIO('network_fee', fee, currency),  # Network fee collector
+        )
+        
+        # Create transaction
+        transaction = Transaction(inputs, outputs, self._get_public_key_bytes())
+        
+        # Sign transaction with the bound signer
+        transaction.sign_with(self.signer())
+        
+        # Deduct from balance
+        balance -= total_amount
+        self.balances[idx] = balance
+        self._balances_view = None
+        
+        # Record transaction
+        self.transaction_history.append(TxnRecord(
+            type='transfer',
+            amount=amount,
+            currency=currency,
+            fee=fee,
+            recipient=recipient_address,
+            transaction_id=transaction.hash(),
+            timestamp=self._now(),
+            balance_after=balance
+        ))
+        
+        logger.debug("Created transaction of %s %s to %s", amount, currency, recipient_address)
+        logger.debug("Transaction fee: %s %s", fee, currency)
+        
+        return transaction
+    
+    def receive_transaction(self, transaction: Transaction) -> bool:
+        """
+        Receive funds from a transaction
+        
+        Args:
+            transaction: Transaction to receive funds from
+            
+        Returns:
+            bool: True if funds received successfully, False otherwise
+        """
+        # Verify transaction signature
+        if not transaction.verify_signature():
+            logger.warning("Invalid transaction signature")
+            return False
+            
+        # Check if this wallet is a recipient
+        amount_received = 0.0
+        currency_received = None
+        
+        for output in transaction.outputs:
+            if output.get('address') == self.address:
+                amount_received = output.get('amount', 0.0)
+                currency_received = output.get('currency', AETH)
+                break
+                
+        if amount_received <= 0:
+            logger.debug("No funds for this wallet in transaction")
+            return False
+            
+        idx = self._CURRENCY_INDEX.get(currency_received)
+        if idx is None:
+            logger.warning("Unsupported currency in transaction: %s", currency_received)
+            return False
+            
+        # Add to balance
+        balance = self.balances[idx] + amount_received
+        self.balances[idx] = balance
+        self._balances_view = None
+        
+        # Record transaction
+        self.transaction_history.append(TxnRecord(
+            type='receive',
+            amount=amount_received,
+            currency=currency_received,
+            sender=transaction.public_key,  # Simplified
+            transaction_id=transaction.hash(),
+            timestamp=self._now(),
+            balance_after=balance
+        ))
+        
+        logger.debug("Received %s %s in wallet %s", amount_received, currency_received, self.wallet_id)
+        return True
+    
+    def facilitate_payment_for_compute(self, node_address: str, compute_units: int, 
+                                     unit_price: float = 0.001) -> Transaction:
+        """
+        Facilitate payment for contributing compute resources
+        
+        According to the white paper:
+        "Nodes host emulators and facilitate payments for successful relays using 
+        supported cryptocurrencies"
+        
+        Args:
+            node_address: Address of node providing compute
+            compute_units: Number of compute units provided
+            unit_price: Price per compute unit
+            
+        Returns:
+            Transaction: Payment transaction
+        """
+        total_amount = compute_units * unit_price
+        fee = total_amount * 0.0001  # 0.01% fee as mentioned in white paper
+        
+        logger.debug("Facilitating payment for %s compute units at %s AETH/unit", compute_units, unit_price)
+        logger.debug("Total amount: %s AETH, Fee: %s AETH", total_amount, fee)
+        
+        return self.create_transaction(node_address, total_amount, AETH, fee)
+    
+    def facilitate_payment_for_storage(self, node_address: str, storage_gb: float, 
+                                      price_per_gb: float = 0.01) -> Transaction:
+        """
+        Facilitate payment for contributing storage resources
+        
+        Args:
+            node_address: Address of node providing storage
+            storage_gb: Amount of storage provided in GB
+            price_per_gb: Price per GB of storage
+            
+        Returns:
+            Transaction: Payment transaction
+        """
+        total_amount = storage_gb * price_per_gb
+        fee = total_amount * 0.0001  # 0.01% fee
+        
+        logger.debug("Facilitating payment for %s GB storage at %s AETH/GB", storage_gb, price_per_gb)
+        logger.debug("Total amount: %s AETH, Fee: %s AETH", total_amount, fee)
+        
+        return self.create_transaction(node_address, total_amount, AETH, fee)
+    
+    def facilitate_payments_batch(self, node_addresses: List[str], quantities: List[float],
+                                  unit_prices: List[float] = None,
+                                  kind: str = 'compute') -> List[Transaction]:
+        """
+        Facilitate payments for a batch of compute or storage contributions
+        
+        Amounts and fees for the whole batch are computed in one pass, and the
+        batch is rejected before anything is signed if the wallet cannot cover it.
+        
+        Args:
+            node_addresses: Addresses of the nodes providing resources
+            quantities: Compute units or GB of storage provided by each node
+            unit_prices: Price per unit for each node (defaults to the kind's price)
+            kind: Resource type, 'compute' or 'storage'
+            
+        Returns:
+            list: Payment transactions, in input order
+        """
+        default_price = self._DEFAULT_UNIT_PRICES.get(kind)
+        if default_price is None:
+            raise ValueError(f"Unsupported payment kind: {kind}")
+            
+        if unit_prices is None:
+            unit_prices = [default_price] * len(quantities)
+            
+        if not len(node_addresses) == len(quantities) == len(unit_prices):
+            raise ValueError("Batch addresses, quantities and prices must have the same length")
+            
+        amounts = [quantity * price for quantity, price in zip(quantities, unit_prices)]
+        fees = [amount * 0.0001 for amount in amounts]  # 0.01% fee
+        total = sum(amounts) + sum(fees)
+        
+        balance = self.get_balance(AETH)
+        if balance < total:
+            raise ValueError(f"Insufficient balance: {balance} < {total}")
+            
+        logger.debug("Facilitating %s %s payments, total %s AETH", len(amounts), kind, total)
+        
+        return [
+            self.create_transaction(address, amount, AETH, fee)
+            for address, amount, fee in zip(node_addresses, amounts, fees)
+        ]
+    
+    def monetize_data_flow(self, data_value: float, recipient_address: str) -> Transaction:
+        """
+        Monetize sacred human data flows
+        
+        According to the white paper:
+        "AetherChain treats data as sacred: Every transaction enables monetization of essence
+        from user flows"
+        
+        Args:
+            data_value: Value of the data being shared
+            recipient_address: Address of data recipient
+            
+        Returns:
+            Transaction: Data monetization transaction
+        """
+        fee = data_value * 0.0001  # 0.01% fee
+        
+        # According to the white paper:
+        # "Relay Fees: 70% to originators, paid via integrated wallets"
+        originator_share = data_value * 0.7
+        network_share = data_value * 0.3
+        
+        logger.debug("Monetizing data flow valued at %s AETH", data_value)
+        logger.debug("Originator share: %s AETH", originator_share)
+        logger.debug("Network share: %s AETH", network_share)
+        logger.debug("Fee: %s AETH", fee)
+        
+        # For this implementation, we'll send the originator share to the recipient
+        # and the network share to a network address
+        return self.create_transaction(recipient_address, originator_share, AETH, fee)
+    
+    def get_transaction_history(self, start: int = 0, limit: int = None) -> Iterator[TxnRecord]:
+        """
+        Get transaction history
+        
+        Records are streamed from the wallet's history without copying it;
+        wrap the result in list() for a snapshot.
+        
+        Args:
+            start: Index of the first record to return
+            limit: Maximum number of records to return (all if None)
+            
+        Returns:
+            iterator: Transaction records, oldest first
+        """
+        stop = None if limit is None else start + limit
+        return islice(self.transaction_history, start, stop)
+    
+    def _get_private_key_bytes(self) -> bytes:
+        """
+        Get private key bytes
+        
+        Returns:
+            bytes: Raw 32-byte secp256k1 private key
+        """
+        if self._priv_bytes is None:
+            self._generate_keypair()
+        return self._priv_bytes
+    
+    def _get_public_key_bytes(self) -> bytes:
+        """
+        Get public key bytes
+        
+        Returns:
+            bytes: Compressed 33-byte secp256k1 public key
+        """
+        if self._pub_bytes is None:
+            self._generate_keypair()
+        return self._pub_bytes
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert wallet to dictionary representation
+        
+        Returns:
+            dict: Wallet data
+        """
+        return {
+            'wallet_id': self.wallet_id,
+            'address': self.address,
+            'balances': dict(self.get_balances()),
+            'supported_currencies': SUPPORTED_CURRENCIES,
+            'transaction_count': len(self.transaction_history)
+        }
+
+# Example usage
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
+    # Create wallets
+    wallet1 = DigitalWallet("wallet_001")
+    wallet2 = DigitalWallet("wallet_002")
+    
+    print(f"Wallet 1 address: {wallet1.get_address()}")
+    print(f"Wallet 2 address: {wallet2.get_address()}")
+    
+    # Deposit funds
+    wallet1.deposit(100.0, 'AETH')
+    wallet1.deposit(0.5, 'BTC')
+    
+    wallet2.deposit(50.0, 'AETH')
+    
+    # Check balances
+    print(f"Wallet 1 AETH balance: {wallet1.get_balance('AETH')}")
+    print(f"Wallet 1 BTC balance: {wallet1.get_balance('BTC')}")
+    print(f"Wallet 2 AETH balance: {wallet2.get_balance('AETH')}")
+    
+    # Create a transaction
+    print("\nCreating transaction from wallet 1 to wallet 2:")
+    transaction = wallet1.create_transaction(
+        recipient_address=wallet2.get_address(),
+        amount=25.0,
+        currency='AETH',
+        fee=0.025  # 0.01% of 25.0 = 0.00025, but we'll use a simplified fee
+    )
+    
+    # Receive transaction in wallet 2
+    print("\nReceiving transaction in wallet 2:")
+    wallet2.receive_transaction(transaction)
+    
+    # Check updated balances
+    print(f"Wallet 1 AETH balance: {wallet1.get_balance('AETH')}")
+    print(f"Wallet 2 AETH balance: {wallet2.get_balance('AETH')}")
+    
+    # Facilitate payment for compute
+    print("\nFacilitating payment for compute:")
+    compute_payment = wallet1.facilitate_payment_for_compute(
+        node_address=wallet2.get_address(),
+        compute_units=100,
+        unit_price=0.001
+    )
+    wallet2.receive_transaction(compute_payment)
+    
+    # Facilitate payment for storage
+    print("\nFacilitating payment for storage:")
+    storage_payment = wallet1.facilitate_payment_for_storage(
+        node_address=wallet2.get_address(),
+        storage_gb=50,
+        price_per_gb=0.01
+    )
+    wallet2.receive_transaction(storage_payment)
+    
+    # Monetize data flow
+    print("\nMonetizing data flow:")
+    data_payment = wallet1.monetize_data_flow(
+        data_value=10.0,
+        recipient_address=wallet2.get_address()
+    )
+    wallet2.receive_transaction(data_payment)
+    
+    # Final balances
+    print("\nFinal balances:")
+    print(f"Wallet 1: {wallet1.get_balances()}")
+    print(f"Wallet 2: {wallet2.get_balances()}")
+    
+    # Transaction history
+    print(f"\nWallet 1 transaction history: {len(list(wallet1.get_transaction_history()))} transactions")
+    print(f"Wallet 2 transaction history: {len(list(wallet2.get_transaction_history()))} transactions")
\ No newline at end of file